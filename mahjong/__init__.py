@@ -8,7 +8,8 @@ Compute hand cost (han, fu, yaku, and scores), validate winning hands, and calcu
 * :class:`~mahjong.hand_calculating.hand.HandCalculator` — estimate hand value (han, fu, cost,
   and yaku list) given tiles, win tile, melds, and dora indicators.
 * :class:`~mahjong.agari.Agari` — check whether tiles form a complete (winning) hand structure.
-* :class:`~mahjong.shanten.Shanten` — calculate how many tiles away a hand is from winning.
+* :func:`~mahjong.shanten.calculate_shanten` (also available as :class:`~mahjong.shanten.Shanten`) — calculate
+  how many tiles away a hand is from winning.
 
 .. rubric:: Tile and meld utilities
 
@@ -30,7 +30,7 @@ class _Block:
             case Meld.KAN | Meld.SHOUMINKAN:
                 return cls(tile_34, _BlockType.QUAD)
             case _:
-                msg = f"invalid meld type: {meld.type}, tiles: {meld.tiles_34}"
+                msg = f"invalid meld type: {meld.type!s}, tiles: {meld.tiles_34}"
                 raise RuntimeError(msg)
 
     @property
@@ -241,7 +241,7 @@ class FuCalculator:
                 state = 0
                 if m.opened:
                     state |= _OPENED
-                if m.type in (Meld.KAN, Meld.SHOUMINKAN):
+                if m.is_kan:
                     state |= _IS_KAN
                 meld_state[tile] = state
 
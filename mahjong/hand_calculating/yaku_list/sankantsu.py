@@ -20,5 +20,4 @@ class SanKantsu(Yaku):
         :param melds: declared melds
         :return: True if three of the melds are kan or shouminkan
         """
-        kan_sets = [x for x in melds if x.type in (Meld.KAN, Meld.SHOUMINKAN)]
-        return len(kan_sets) == 3
+        return sum(x.is_kan for x in melds) == 3
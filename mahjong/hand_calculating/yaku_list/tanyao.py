@@ -16,4 +16,4 @@ class Tanyao(Yaku):
     def is_condition_met(self, hand: Collection[Sequence[int]], *args) -> bool:
         """Check whether all tiles in the hand are simple tiles (no terminals or honors)."""
         indices = chain.from_iterable(hand)
-        return not any(x in TERMINAL_AND_HONOR_INDICES for x in indices)
+        return TERMINAL_AND_HONOR_INDICES.isdisjoint(indices)
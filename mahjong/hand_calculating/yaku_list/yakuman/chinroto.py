@@ -17,4 +17,4 @@ class Chinroutou(Yaku):
     def is_condition_met(self, hand: Collection[Sequence[int]], *args) -> bool:
         """Check whether all tiles in the hand are terminals."""
         indices = chain.from_iterable(hand)
-        return all(x in TERMINAL_INDICES for x in indices)
+        return TERMINAL_INDICES.issuperset(indices)
@@ -16,4 +16,4 @@ class Daichisei(Yaku):
     def is_condition_met(self, hand: Collection[Sequence[int]], *args) -> bool:
         """Check whether the hand is seven pairs composed entirely of honor tiles."""
         indices = chain.from_iterable(hand)
-        return all(x in HONOR_INDICES for x in indices) and len(hand) == 7
+        return len(hand) == 7 and HONOR_INDICES.issuperset(indices)
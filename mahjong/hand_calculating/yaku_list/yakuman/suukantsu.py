@@ -21,5 +21,4 @@ class Suukantsu(Yaku):
         :param melds: declared melds
         :return: True if four of the melds are kan or shouminkan
         """
-        kan_sets = [x for x in melds if x.type in (Meld.KAN, Meld.SHOUMINKAN)]
-        return len(kan_sets) == 4
+        return sum(x.is_kan for x in melds) == 4
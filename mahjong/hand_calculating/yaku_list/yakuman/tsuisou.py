@@ -17,4 +17,4 @@ class Tsuuiisou(Yaku):
     def is_condition_met(self, hand: Collection[Sequence[int]], *args) -> bool:
         """Check whether all tiles in the hand are honors."""
         indices = chain.from_iterable(hand)
-        return all(x in HONOR_INDICES for x in indices)
+        return HONOR_INDICES.issuperset(indices)
@@ -1,9 +1,41 @@
 from collections.abc import Sequence
-from functools import cached_property
+from dataclasses import dataclass, field
+from enum import IntEnum
 
-from mahjong.tile import TilesConverter
 
+class MeldType(IntEnum):
+    """
+    Meld type identifiers.
+
+    Integer values keep ``meld.type == Meld.KAN`` style checks cheap; ``str()`` returns
+    the lowercase name used for display.
+
+    >>> from mahjong.meld import MeldType
+    >>> str(MeldType.SHOUMINKAN)
+    'shouminkan'
+    """
+
+    CHI = 0
+    """Chi (sequence) — three consecutive suited tiles."""
 
+    PON = 1
+    """Pon (triplet) — three identical tiles."""
+
+    KAN = 2
+    """Kan (quad) — four identical tiles."""
+
+    SHOUMINKAN = 3
+    """Shouminkan (added kan) — extending a pon with the fourth tile."""
+
+    NUKI = 4
+    """Nuki (north wind extraction), at the moment is not used in the library."""
+
+    def __str__(self) -> str:
+        """Return the lowercase meld type name."""
+        return self.name.lower()
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class Meld:
     """
     Representation of a declared meld (called or concealed tile group).
@@ -18,6 +50,9 @@ class Meld:
     - **Shouminkan** — an added kan (extending an existing pon with the fourth tile).
     - **Nuki** — a special declaration used in three-player mahjong (north wind extraction).
 
+    Melds are immutable value objects: attributes cannot be reassigned after construction,
+    and two melds with the same attributes compare equal.
+
     Create an open chi meld:
 
     >>> from mahjong.meld import Meld
@@ -25,9 +60,9 @@ class Meld:
     >>> tiles = TilesConverter.string_to_136_array(man="123")
     >>> meld = Meld(meld_type=Meld.CHI, tiles=tiles)
     >>> meld.type
-    'chi'
-    >>> meld.tiles
-    (0, 4, 8)
+    <MeldType.CHI: 0>
+    >>> list(meld.tiles)
+    [0, 4, 8]
 
     Create a closed kan:
 
@@ -37,9 +72,12 @@ class Meld:
     False
 
     :ivar type: one of the meld type constants (CHI, PON, KAN, SHOUMINKAN, NUKI)
-    :vartype type: str | None
-    :ivar tiles: tile indices in 136-format, stored as an immutable tuple
-    :vartype tiles: tuple[int, ...]
+    :vartype type: MeldType | None
+    :ivar tiles: tile indices in 136-format, stored compactly as immutable bytes
+        (indexing and iteration yield ints)
+    :vartype tiles: bytes
+    :ivar tiles_34: the same tiles in 34-format, computed once when the meld is created
+    :vartype tiles_34: list[int]
     :ivar opened: True for open melds (called from another player), False for closed kan
     :vartype opened: bool
     :ivar called_tile: the specific tile index (136-format) that was called to form this meld
@@ -50,23 +88,25 @@ class Meld:
     :vartype from_who: int | None
     """
 
-    CHI = "chi"
+    CHI = MeldType.CHI
     """Chi (sequence) meld type — three consecutive suited tiles."""
 
-    PON = "pon"
+    PON = MeldType.PON
     """Pon (triplet) meld type — three identical tiles."""
 
-    KAN = "kan"
+    KAN = MeldType.KAN
     """Kan (quad) meld type — four identical tiles."""
 
-    SHOUMINKAN = "shouminkan"
+    SHOUMINKAN = MeldType.SHOUMINKAN
     """Shouminkan (added kan) meld type — extending a pon with the fourth tile."""
 
-    NUKI = "nuki"
+    NUKI = MeldType.NUKI
     """Nuki (north wind extraction) meld type, at the moment is not used in the library."""
 
-    type: str | None
-    tiles: tuple[int, ...]
+    type: MeldType | None
+    tiles: bytes
+    # derived from tiles, so it takes no part in equality and hashing
+    tiles_34: list[int] = field(compare=False)
     opened: bool
     called_tile: int | None
     who: int | None
@@ -74,7 +114,7 @@ class Meld:
 
     def __init__(
         self,
-        meld_type: str | None = None,
+        meld_type: MeldType | None = None,
         tiles: Sequence[int] | None = None,
         opened: bool = True,
         called_tile: int | None = None,
@@ -89,9 +129,11 @@ class Meld:
         >>> tiles = TilesConverter.string_to_136_array(man="111")
         >>> meld = Meld(meld_type=Meld.PON, tiles=tiles, who=0, from_who=2)
         >>> meld.type
-        'pon'
+        <MeldType.PON: 1>
         >>> meld.who
         0
+        >>> meld.tiles_34
+        [0, 0, 0]
 
         :param meld_type: one of the meld type constants (CHI, PON, KAN, SHOUMINKAN, NUKI)
         :param tiles: tile indices in 136-format
@@ -100,18 +142,13 @@ class Meld:
         :param who: seat index (0-3) of the player who declared the meld
         :param from_who: seat index (0-3) of the player who discarded the called tile
         """
-        self.type = meld_type
-        self.tiles = tuple(tiles) if tiles else ()
-        self.opened = opened
-        self.called_tile = called_tile
-        self.who = who
-        self.from_who = from_who
-
-    def __setattr__(self, name: str, value: object) -> None:
-        """Invalidate the tiles_34 cache when tiles are reassigned."""
-        super().__setattr__(name, value)
-        if name == "tiles" and "tiles_34" in self.__dict__:
-            del self.__dict__["tiles_34"]
+        object.__setattr__(self, "type", meld_type)
+        object.__setattr__(self, "tiles", bytes(tiles) if tiles else b"")
+        object.__setattr__(self, "tiles_34", [x >> 2 for x in self.tiles])
+        object.__setattr__(self, "opened", opened)
+        object.__setattr__(self, "called_tile", called_tile)
+        object.__setattr__(self, "who", who)
+        object.__setattr__(self, "from_who", from_who)
 
     def __str__(self) -> str:
         """
@@ -124,24 +161,27 @@ class Meld:
         >>> str(meld)
         'Type: chi, Tiles: 123m (0, 4, 8)'
         """
-        return f"Type: {self.type}, Tiles: {TilesConverter.to_one_line_string(self.tiles)} {self.tiles}"
+        # imported here so that importing Meld does not load the tile conversion module
+        from mahjong.tile import TilesConverter  # noqa: PLC0415
+
+        return f"Type: {self.type!s}, Tiles: {TilesConverter.to_one_line_string(self.tiles)} {tuple(self.tiles)}"
 
     def __repr__(self) -> str:
         """Return the same representation as __str__."""
         return self.__str__()
 
-    @cached_property
-    def tiles_34(self) -> list[int]:
+    @property
+    def is_kan(self) -> bool:
         """
-        Convert the meld's 136-format tile indices to 34-format tile indices.
+        Check whether the meld is a kan, including an added kan (shouminkan).
 
         >>> from mahjong.meld import Meld
         >>> from mahjong.tile import TilesConverter
-        >>> tiles = TilesConverter.string_to_136_array(man="111")
-        >>> meld = Meld(meld_type=Meld.PON, tiles=tiles)
-        >>> meld.tiles_34
-        [0, 0, 0]
+        >>> Meld(meld_type=Meld.SHOUMINKAN, tiles=TilesConverter.string_to_136_array(man="1111")).is_kan
+        True
+        >>> Meld(meld_type=Meld.PON, tiles=TilesConverter.string_to_136_array(man="111")).is_kan
+        False
 
-        :return: list of tile indices in 34-format
+        :return: True if the meld type is KAN or SHOUMINKAN
         """
-        return [x // 4 for x in self.tiles]
+        return self.type in (Meld.KAN, Meld.SHOUMINKAN)
@@ -1,7 +1,181 @@
 from collections.abc import Sequence
+from functools import lru_cache
+from operator import itemgetter
 
 from mahjong.constants import TERMINAL_AND_HONOR_INDICES
 
+# gathers the counts of the 13 kokushi tiles in a single C-level call
+_get_kokushi_tiles = itemgetter(*sorted(TERMINAL_AND_HONOR_INDICES))
+
+
+TENPAI_STATE = 0
+"""Hand is tenpai — one tile away from winning."""
+
+AGARI_STATE = -1
+"""Hand is complete (agari)."""
+
+
+def calculate_shanten(
+    tiles_34: Sequence[int],
+    use_chiitoitsu: bool = True,
+    use_kokushi: bool = True,
+    is_three_player: bool = False,
+) -> int:
+    """
+    Return the minimum shanten number across regular, chiitoitsu, and kokushi hand types.
+
+    A pair alone is a complete hand (remaining melds are implied open):
+
+    >>> tiles_34 = [0] * 34
+    >>> tiles_34[0] = 2
+    >>> calculate_shanten(tiles_34)
+    -1
+
+    A triplet with an isolated tile is tenpai (one tile needed for the pair):
+
+    >>> tiles_34 = [0] * 34
+    >>> tiles_34[0] = 3
+    >>> tiles_34[9] = 1
+    >>> calculate_shanten(tiles_34)
+    0
+
+    :param tiles_34: hand in 34-format count array (length 34)
+    :param use_chiitoitsu: include seven pairs pattern in calculation
+    :param use_kokushi: include thirteen orphans pattern in calculation
+    :param is_three_player: if True, calculate using three-player rules where 2m-8m are unavailable
+    :return: minimum shanten number (-1 for agari, 0 for tenpai, positive for tiles needed)
+    :raises ValueError: if tile count exceeds 14, is divisible by 3, or contains 2m-8m
+        when ``is_three_player`` is True
+    """
+    return _calculate_shanten_cached(tuple(tiles_34), use_chiitoitsu, use_kokushi, is_three_player)
+
+
+@lru_cache(maxsize=65536)
+def _calculate_shanten_cached(
+    tiles_34: tuple[int, ...],
+    use_chiitoitsu: bool,
+    use_kokushi: bool,
+    is_three_player: bool,
+) -> int:
+    """Calculate the shanten number of a hand given as a hashable tuple."""
+    count_of_tiles = sum(tiles_34)
+
+    # chiitoitsu and kokushi are cheap to evaluate, and their result bounds the regular hand search
+    min_shanten = 8
+    if count_of_tiles >= 13:
+        if use_chiitoitsu:
+            min_shanten = min(min_shanten, calculate_shanten_for_chiitoitsu_hand(tiles_34))
+        if use_kokushi:
+            min_shanten = min(min_shanten, calculate_shanten_for_kokushi_hand(tiles_34))
+
+    return _calculate_regular_shanten(tiles_34, count_of_tiles, is_three_player, min_shanten)
+
+
+def calculate_shanten_for_chiitoitsu_hand(tiles_34: Sequence[int]) -> int:
+    """
+    Calculate the shanten number for a chiitoitsu (seven pairs) hand.
+
+    Count the number of pairs and unique tile kinds to determine
+    how far the hand is from completing seven distinct pairs.
+
+    Seven distinct pairs form a complete hand:
+
+    >>> tiles_34 = [2, 2, 2, 2, 2, 2, 2] + [0] * 27
+    >>> calculate_shanten_for_chiitoitsu_hand(tiles_34)
+    -1
+
+    Six pairs with two singles — tenpai:
+
+    >>> tiles_34 = [2, 2, 2, 2, 2, 2, 1, 1] + [0] * 26
+    >>> calculate_shanten_for_chiitoitsu_hand(tiles_34)
+    0
+
+    :param tiles_34: hand in 34-format count array (length 34)
+    :return: shanten number for chiitoitsu (-1 for complete, 0-6 otherwise)
+    """
+    # Sequence.count runs in C for lists and tuples, so count the empty and single kinds
+    # instead of filtering the array twice
+    kinds = len(tiles_34) - tiles_34.count(0)
+    pairs = kinds - tiles_34.count(1)
+    if pairs == 7:
+        return AGARI_STATE
+
+    return 6 - pairs + (7 - kinds if kinds < 7 else 0)
+
+
+def calculate_shanten_for_kokushi_hand(tiles_34: Sequence[int]) -> int:
+    """
+    Calculate the shanten number for a kokushi musou (thirteen orphans) hand.
+
+    Kokushi requires one of each terminal (1, 9 of each suit) and each honor tile,
+    plus one duplicate. Count how many of the 13 required tiles are present
+    and whether any appears twice.
+
+    All 13 terminal/honor tiles with one duplicate form a complete hand:
+
+    >>> tiles_34 = [0] * 34
+    >>> for i in [0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33]:
+    ...    tiles_34[i] = 1
+    >>> tiles_34[33] = 2
+    >>> calculate_shanten_for_kokushi_hand(tiles_34)
+    -1
+
+    :param tiles_34: hand in 34-format count array (length 34)
+    :return: shanten number for kokushi (-1 for complete, 0-13 otherwise)
+    """
+    kokushi_tiles = _get_kokushi_tiles(tiles_34)
+    missing_tiles = kokushi_tiles.count(0)
+    has_pair = missing_tiles + kokushi_tiles.count(1) < len(kokushi_tiles)
+
+    return missing_tiles - (1 if has_pair else 0)
+
+
+def calculate_shanten_for_regular_hand(tiles_34: Sequence[int], is_three_player: bool = False) -> int:
+    """
+    Calculate the shanten number for a regular hand (4 melds + 1 pair).
+
+    The number of melds to be calculated is determined based on the number of tiles in the hand.
+    The number of melds is determined as ``number_of_tiles // 3``
+    (e.g., 0 for 1-2 tiles, 1 for 4-5 tiles, ..., 4 for 13-14 tiles).
+    If there are fewer than 4 melds, the remaining melds are treated as open melds.
+
+    Honor tiles (indices 27-33) are pre-processed directly. Each suit of the suited tiles
+    (indices 0-26) is decomposed into melds, pairs, and tatsu independently by a depth-first search,
+    the results are cached per suit, and the suits are then combined to find the minimum.
+
+    A pair alone is a complete hand (remaining melds are implied open):
+
+    >>> tiles_34 = [0] * 34
+    >>> tiles_34[0] = 2
+    >>> calculate_shanten_for_regular_hand(tiles_34)
+    -1
+
+    A triplet with an isolated tile is tenpai:
+
+    >>> tiles_34 = [0] * 34
+    >>> tiles_34[0] = 3
+    >>> tiles_34[9] = 1
+    >>> calculate_shanten_for_regular_hand(tiles_34)
+    0
+
+    Three-player shanten can differ from four-player shanten:
+
+    >>> from mahjong.tile import TilesConverter
+    >>> tiles_34 = TilesConverter.one_line_string_to_34_array("1111m111122233z")
+    >>> calculate_shanten_for_regular_hand(tiles_34)
+    1
+    >>> calculate_shanten_for_regular_hand(tiles_34, is_three_player=True)
+    2
+
+    :param tiles_34: hand in 34-format count array (length 34)
+    :param is_three_player: if True, calculate using three-player rules where 2m-8m are unavailable
+    :return: shanten number for regular hand (-1 for complete, 0+ otherwise)
+    :raises ValueError: if tile count exceeds 14, is divisible by 3, or contains 2m-8m
+        when ``is_three_player`` is True
+    """
+    # with the other hand types disabled the memoised full calculation is exactly the regular hand search
+    return _calculate_shanten_cached(tuple(tiles_34), False, False, is_three_player)
+
 
 class Shanten:
     """
@@ -17,430 +191,358 @@ class Shanten:
 
     Supports three hand types: regular (4 melds + 1 pair), chiitoitsu (seven pairs),
     and kokushi musou (thirteen orphans).
+
+    The methods are the module-level functions of :mod:`mahjong.shanten` exposed as static methods.
+    The class holds no state, so both forms are safe to call from several threads.
+
+    >>> tiles_34 = [0] * 34
+    >>> tiles_34[0] = 2
+    >>> Shanten.calculate_shanten(tiles_34)
+    -1
     """
 
-    TENPAI_STATE = 0
+    TENPAI_STATE = TENPAI_STATE
     """Hand is tenpai — one tile away from winning."""
 
-    AGARI_STATE = -1
+    AGARI_STATE = AGARI_STATE
     """Hand is complete (agari)."""
 
-    @staticmethod
-    def calculate_shanten(
-        tiles_34: Sequence[int],
-        use_chiitoitsu: bool = True,
-        use_kokushi: bool = True,
-        is_three_player: bool = False,
-    ) -> int:
-        """
-        Return the minimum shanten number across regular, chiitoitsu, and kokushi hand types.
-
-        A pair alone is a complete hand (remaining melds are implied open):
-
-        >>> tiles_34 = [0] * 34
-        >>> tiles_34[0] = 2
-        >>> Shanten.calculate_shanten(tiles_34)
-        -1
-
-        A triplet with an isolated tile is tenpai (one tile needed for the pair):
-
-        >>> tiles_34 = [0] * 34
-        >>> tiles_34[0] = 3
-        >>> tiles_34[9] = 1
-        >>> Shanten.calculate_shanten(tiles_34)
-        0
-
-        :param tiles_34: hand in 34-format count array (length 34)
-        :param use_chiitoitsu: include seven pairs pattern in calculation
-        :param use_kokushi: include thirteen orphans pattern in calculation
-        :param is_three_player: if True, calculate using three-player rules where 2m-8m are unavailable
-        :return: minimum shanten number (-1 for agari, 0 for tenpai, positive for tiles needed)
-        :raises ValueError: if tile count exceeds 14, is divisible by 3, or contains 2m-8m
-            when ``is_three_player`` is True
-        """
-        count_of_tiles = sum(tiles_34)
-        shanten_results = [_RegularShanten(tiles_34).calculate(count_of_tiles, is_three_player)]
-
-        if count_of_tiles >= 13:
-            if use_chiitoitsu:
-                shanten_results.append(Shanten.calculate_shanten_for_chiitoitsu_hand(tiles_34))
-            if use_kokushi:
-                shanten_results.append(Shanten.calculate_shanten_for_kokushi_hand(tiles_34))
-
-        return min(shanten_results)
-
-    @staticmethod
-    def calculate_shanten_for_chiitoitsu_hand(tiles_34: Sequence[int]) -> int:
-        """
-        Calculate the shanten number for a chiitoitsu (seven pairs) hand.
-
-        Count the number of pairs and unique tile kinds to determine
-        how far the hand is from completing seven distinct pairs.
-
-        Seven distinct pairs form a complete hand:
-
-        >>> tiles_34 = [2, 2, 2, 2, 2, 2, 2] + [0] * 27
-        >>> Shanten.calculate_shanten_for_chiitoitsu_hand(tiles_34)
-        -1
-
-        Six pairs with two singles — tenpai:
-
-        >>> tiles_34 = [2, 2, 2, 2, 2, 2, 1, 1] + [0] * 26
-        >>> Shanten.calculate_shanten_for_chiitoitsu_hand(tiles_34)
-        0
-
-        :param tiles_34: hand in 34-format count array (length 34)
-        :return: shanten number for chiitoitsu (-1 for complete, 0-6 otherwise)
-        """
-        pairs = len([x for x in tiles_34 if x >= 2])
-        if pairs == 7:
-            return Shanten.AGARI_STATE
-
-        kinds = len([x for x in tiles_34 if x >= 1])
-        return 6 - pairs + (7 - kinds if kinds < 7 else 0)
-
-    @staticmethod
-    def calculate_shanten_for_kokushi_hand(tiles_34: Sequence[int]) -> int:
-        """
-        Calculate the shanten number for a kokushi musou (thirteen orphans) hand.
-
-        Kokushi requires one of each terminal (1, 9 of each suit) and each honor tile,
-        plus one duplicate. Count how many of the 13 required tiles are present
-        and whether any appears twice.
-
-        All 13 terminal/honor tiles with one duplicate form a complete hand:
-
-        >>> tiles_34 = [0] * 34
-        >>> for i in [0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33]:
-        ...    tiles_34[i] = 1
-        >>> tiles_34[33] = 2
-        >>> Shanten.calculate_shanten_for_kokushi_hand(tiles_34)
-        -1
-
-        :param tiles_34: hand in 34-format count array (length 34)
-        :return: shanten number for kokushi (-1 for complete, 0-13 otherwise)
-        """
-        completed_terminals = 0
-        terminals = 0
-        for i in TERMINAL_AND_HONOR_INDICES:
-            completed_terminals += tiles_34[i] >= 2
-            terminals += tiles_34[i] != 0
-
-        return 13 - terminals - (1 if completed_terminals else 0)
-
-    @staticmethod
-    def calculate_shanten_for_regular_hand(tiles_34: Sequence[int], is_three_player: bool = False) -> int:
-        """
-        Calculate the shanten number for a regular hand (4 melds + 1 pair).
-
-        The number of melds to be calculated is determined based on the number of tiles in the hand.
-        The number of melds is determined as ``number_of_tiles // 3``
-        (e.g., 0 for 1-2 tiles, 1 for 4-5 tiles, ..., 4 for 13-14 tiles).
-        If there are fewer than 4 melds, the remaining melds are treated as open melds.
-
-        Use a depth-first search over all possible meld/pair/tatsu decompositions
-        of the suited tiles (indices 0-26), after pre-processing honor tiles (indices 27-33).
-
-        A pair alone is a complete hand (remaining melds are implied open):
-
-        >>> tiles_34 = [0] * 34
-        >>> tiles_34[0] = 2
-        >>> Shanten.calculate_shanten_for_regular_hand(tiles_34)
-        -1
-
-        A triplet with an isolated tile is tenpai:
-
-        >>> tiles_34 = [0] * 34
-        >>> tiles_34[0] = 3
-        >>> tiles_34[9] = 1
-        >>> Shanten.calculate_shanten_for_regular_hand(tiles_34)
-        0
-
-        Three-player shanten can differ from four-player shanten:
-
-        >>> from mahjong.tile import TilesConverter
-        >>> tiles_34 = TilesConverter.one_line_string_to_34_array("1111m111122233z")
-        >>> Shanten.calculate_shanten_for_regular_hand(tiles_34)
-        1
-        >>> Shanten.calculate_shanten_for_regular_hand(tiles_34, is_three_player=True)
-        2
-
-        :param tiles_34: hand in 34-format count array (length 34)
-        :param is_three_player: if True, calculate using three-player rules where 2m-8m are unavailable
-        :return: shanten number for regular hand (-1 for complete, 0+ otherwise)
-        :raises ValueError: if tile count exceeds 14, is divisible by 3, or contains 2m-8m
-            when ``is_three_player`` is True
-        """
-        count_of_tiles = sum(tiles_34)
-        return _RegularShanten(tiles_34).calculate(count_of_tiles, is_three_player)
-
-
-class _RegularShanten:
-    def __init__(self, tiles_34: Sequence[int]) -> None:
-        # we will modify tiles array later, so we need to use a copy
-        self._tiles = list(tiles_34)
-        self._number_melds = 0
-        self._number_tatsu = 0
-        self._number_pairs = 0
-        self._number_jidahai = 0
-        self._flag_four_copies = 0
-        self._flag_isolated_tiles = 0
-        self._min_shanten = 8
-
-    def calculate(self, count_of_tiles: int, is_three_player: bool) -> int:
-        if is_three_player and any(self._tiles[1:8]):
-            msg = "Invalid tile for three player"
-            raise ValueError(msg)
-
-        if count_of_tiles > 14:
-            msg = f"Too many tiles = {count_of_tiles}"
-            raise ValueError(msg)
-
-        if count_of_tiles % 3 == 0:
-            msg = f"Invalid tile count = {count_of_tiles}. Valid counts: 1, 2, 4, 5, 7, 8, 10, 11, 13, 14."
-            raise ValueError(msg)
-
-        self._remove_honor_and_terminal_man_tiles(count_of_tiles, is_three_player)
-
-        init_mentsu = (14 - count_of_tiles) // 3
-        self._scan(init_mentsu, is_three_player)
-
-        return self._min_shanten
-
-    def _scan(self, init_mentsu: int, is_three_player: bool) -> None:
-        for i in range(27):
-            self._flag_four_copies |= (self._tiles[i] == 4) << i
-        self._number_melds += init_mentsu
-        # Four-player hands scan from 1m. Three-player hands skip the manzu suit,
-        # and start from 1p. The 1m and 9m are pre-processed with honors,
-        # and 2m-8m are unavailable.
-        self._run(9 if is_three_player else 0)
-
-    def _run(self, depth: int) -> None:
-        if self._min_shanten == Shanten.AGARI_STATE:
-            return None
-
-        while not self._tiles[depth]:
-            depth += 1
-
-            if depth >= 27:
-                break
-
-        if depth >= 27:
-            return self._update_result()
-
-        i = depth
-        if i > 8:
-            i -= 9
-        if i > 8:
-            i -= 9
-
-        if self._tiles[depth] == 4:
-            self._increase_set(depth)
-            if i < 7 and self._tiles[depth + 2]:
-                if self._tiles[depth + 1]:
-                    self._increase_syuntsu(depth)
-                    self._run(depth + 1)
-                    self._decrease_syuntsu(depth)
-                self._increase_tatsu_second(depth)
-                self._run(depth + 1)
-                self._decrease_tatsu_second(depth)
-
-            if i < 8 and self._tiles[depth + 1]:
-                self._increase_tatsu_first(depth)
-                self._run(depth + 1)
-                self._decrease_tatsu_first(depth)
-
-            self._increase_isolated_tile(depth)
-            self._run(depth + 1)
-            self._decrease_isolated_tile(depth)
-            self._decrease_set(depth)
-            self._increase_pair(depth)
-
-            if i < 7 and self._tiles[depth + 2]:
-                if self._tiles[depth + 1]:
-                    self._increase_syuntsu(depth)
-                    self._run(depth)
-                    self._decrease_syuntsu(depth)
-                self._increase_tatsu_second(depth)
-                self._run(depth + 1)
-                self._decrease_tatsu_second(depth)
-
-            if i < 8 and self._tiles[depth + 1]:
-                self._increase_tatsu_first(depth)
-                self._run(depth + 1)
-                self._decrease_tatsu_first(depth)
-
-            self._decrease_pair(depth)
-
-        if self._tiles[depth] == 3:
-            self._increase_set(depth)
-            self._run(depth + 1)
-            self._decrease_set(depth)
-            self._increase_pair(depth)
-
-            if i < 7 and self._tiles[depth + 1] and self._tiles[depth + 2]:
-                self._increase_syuntsu(depth)
-                self._run(depth + 1)
-                self._decrease_syuntsu(depth)
-            else:
-                if i < 7 and self._tiles[depth + 2]:
-                    self._increase_tatsu_second(depth)
-                    self._run(depth + 1)
-                    self._decrease_tatsu_second(depth)
-
-                if i < 8 and self._tiles[depth + 1]:
-                    self._increase_tatsu_first(depth)
-                    self._run(depth + 1)
-                    self._decrease_tatsu_first(depth)
-
-            self._decrease_pair(depth)
-
-            if i < 7 and self._tiles[depth + 2] >= 2 and self._tiles[depth + 1] >= 2:
-                self._increase_syuntsu(depth)
-                self._increase_syuntsu(depth)
-                self._run(depth)
-                self._decrease_syuntsu(depth)
-                self._decrease_syuntsu(depth)
-
-        if self._tiles[depth] == 2:
-            self._increase_pair(depth)
-            self._run(depth + 1)
-            self._decrease_pair(depth)
-            if i < 7 and self._tiles[depth + 2] and self._tiles[depth + 1]:
-                self._increase_syuntsu(depth)
-                self._run(depth)
-                self._decrease_syuntsu(depth)
-
-        if self._tiles[depth] == 1:
-            if i < 6 and self._tiles[depth + 1] == 1 and self._tiles[depth + 2] and self._tiles[depth + 3] != 4:
-                self._increase_syuntsu(depth)
-                self._run(depth + 2)
-                self._decrease_syuntsu(depth)
-            else:
-                self._increase_isolated_tile(depth)
-                self._run(depth + 1)
-                self._decrease_isolated_tile(depth)
-
-                if i < 7 and self._tiles[depth + 2]:
-                    if self._tiles[depth + 1]:
-                        self._increase_syuntsu(depth)
-                        self._run(depth + 1)
-                        self._decrease_syuntsu(depth)
-                    self._increase_tatsu_second(depth)
-                    self._run(depth + 1)
-                    self._decrease_tatsu_second(depth)
-
-                if i < 8 and self._tiles[depth + 1]:
-                    self._increase_tatsu_first(depth)
-                    self._run(depth + 1)
-                    self._decrease_tatsu_first(depth)
-
-        return None
-
-    def _update_result(self) -> None:
-        ret_shanten = 8 - self._number_melds * 2 - self._number_tatsu - self._number_pairs
-        n_mentsu_kouho = self._number_melds + self._number_tatsu
-        if self._number_pairs:
-            n_mentsu_kouho += self._number_pairs - 1
-        elif (
-            self._flag_four_copies
-            and self._flag_isolated_tiles
-            and (self._flag_four_copies | self._flag_isolated_tiles) == self._flag_four_copies
-        ):
-            ret_shanten += 1
-
-        if n_mentsu_kouho > 4:
-            ret_shanten += n_mentsu_kouho - 4
-
-        if ret_shanten != Shanten.AGARI_STATE and ret_shanten < self._number_jidahai:
-            ret_shanten = self._number_jidahai
-
-        self._min_shanten = min(self._min_shanten, ret_shanten)
-
-    def _increase_set(self, k: int) -> None:
-        self._tiles[k] -= 3
-        self._number_melds += 1
-
-    def _decrease_set(self, k: int) -> None:
-        self._tiles[k] += 3
-        self._number_melds -= 1
-
-    def _increase_pair(self, k: int) -> None:
-        self._tiles[k] -= 2
-        self._number_pairs += 1
-
-    def _decrease_pair(self, k: int) -> None:
-        self._tiles[k] += 2
-        self._number_pairs -= 1
-
-    def _increase_syuntsu(self, k: int) -> None:
-        self._tiles[k] -= 1
-        self._tiles[k + 1] -= 1
-        self._tiles[k + 2] -= 1
-        self._number_melds += 1
-
-    def _decrease_syuntsu(self, k: int) -> None:
-        self._tiles[k] += 1
-        self._tiles[k + 1] += 1
-        self._tiles[k + 2] += 1
-        self._number_melds -= 1
-
-    def _increase_tatsu_first(self, k: int) -> None:
-        self._tiles[k] -= 1
-        self._tiles[k + 1] -= 1
-        self._number_tatsu += 1
-
-    def _decrease_tatsu_first(self, k: int) -> None:
-        self._tiles[k] += 1
-        self._tiles[k + 1] += 1
-        self._number_tatsu -= 1
-
-    def _increase_tatsu_second(self, k: int) -> None:
-        self._tiles[k] -= 1
-        self._tiles[k + 2] -= 1
-        self._number_tatsu += 1
-
-    def _decrease_tatsu_second(self, k: int) -> None:
-        self._tiles[k] += 1
-        self._tiles[k + 2] += 1
-        self._number_tatsu -= 1
-
-    def _increase_isolated_tile(self, k: int) -> None:
-        self._tiles[k] -= 1
-        self._flag_isolated_tiles |= 1 << k
-
-    def _decrease_isolated_tile(self, k: int) -> None:
-        self._tiles[k] += 1
-        self._flag_isolated_tiles &= ~(1 << k)
-
-    def _remove_honor_and_terminal_man_tiles(self, nc: int, is_three_player: bool) -> None:
-        four_copies = 0
-        isolated = 0
-        indices = list(range(27, 34))
-        if is_three_player:
-            indices.extend([0, 8])
-
-        for flag_pos, i in enumerate(indices):
-            if self._tiles[i] == 4:
-                self._number_melds += 1
-                self._number_jidahai += 1
-                four_copies |= 1 << flag_pos
-                isolated |= 1 << flag_pos
-
-            if self._tiles[i] == 3:
-                self._number_melds += 1
-
-            if self._tiles[i] == 2:
-                self._number_pairs += 1
-
-            if self._tiles[i] == 1:
-                isolated |= 1 << flag_pos
-
-        if self._number_jidahai and (nc % 3) == 2:
-            self._number_jidahai -= 1
-
-        if isolated:
-            self._flag_isolated_tiles |= 1 << 27
-            if (four_copies | isolated) == four_copies:
-                self._flag_four_copies |= 1 << 27
+    calculate_shanten = staticmethod(calculate_shanten)
+    calculate_shanten_for_chiitoitsu_hand = staticmethod(calculate_shanten_for_chiitoitsu_hand)
+    calculate_shanten_for_kokushi_hand = staticmethod(calculate_shanten_for_kokushi_hand)
+    calculate_shanten_for_regular_hand = staticmethod(calculate_shanten_for_regular_hand)
+
+
+_SUIT_SIZE = 9
+
+_NO_ISOLATED = 0
+_ISOLATED_FOUR_COPIES = 1
+_ISOLATED_OTHER = 2
+
+# Ranks the isolated-tile state of a suit pattern by how favourable it is once combined with
+# the other suits: a stray non-quad tile can never trigger the penalty, no isolated tiles
+# are neutral, and isolated tiles that are all quads may trigger it.
+_ISOLATED_STATE_RANK = (1, 0, 2)
+
+# (melds, tatsu, pairs, isolated state) of a partial decomposition
+_Pattern = tuple[int, int, int, int]
+
+
+def _calculate_regular_shanten(
+    tiles_34: Sequence[int],
+    count_of_tiles: int,
+    is_three_player: bool,
+    min_shanten: int,
+) -> int:
+    """Calculate the regular hand shanten number, never returning more than ``min_shanten``."""
+    if is_three_player and any(tiles_34[1:8]):
+        msg = "Invalid tile for three player"
+        raise ValueError(msg)
+
+    if count_of_tiles > 14:
+        msg = f"Too many tiles = {count_of_tiles}"
+        raise ValueError(msg)
+
+    if count_of_tiles % 3 == 0:
+        msg = f"Invalid tile count = {count_of_tiles}. Valid counts: 1, 2, 4, 5, 7, 8, 10, 11, 13, 14."
+        raise ValueError(msg)
+
+    # nothing can beat a hand that is already complete
+    if min_shanten == AGARI_STATE:
+        return min_shanten
+
+    # Honors never form sequences, and neither do 1m and 9m in three-player games,
+    # where 2m-8m are unavailable, so they are counted directly.
+    tiles = [*tiles_34[27:34], tiles_34[0], tiles_34[8]] if is_three_player else list(tiles_34[27:34])
+    number_quads = tiles.count(4)
+    # missing melds of the hand are implied open
+    number_melds = (14 - count_of_tiles) // 3 + tiles.count(3) + number_quads
+    number_pairs = tiles.count(2)
+    number_jidahai = number_quads
+    if number_jidahai and count_of_tiles % 3 == 2:
+        number_jidahai -= 1
+
+    # a quad leaves its fourth copy isolated, and a single copy is an ordinary isolated tile
+    if 1 in tiles:
+        isolated_state = _ISOLATED_OTHER
+    elif number_quads:
+        isolated_state = _ISOLATED_FOUR_COPIES
+    else:
+        isolated_state = _NO_ISOLATED
+
+    # Four-player hands scan from 1m. Three-player hands skip the manzu suit and start from 1p.
+    patterns = {(number_melds, 0, number_pairs, isolated_state)}
+    for suit_start in range(9 if is_three_player else 0, 27, _SUIT_SIZE):
+        suit_patterns = _suit_patterns(tuple(tiles_34[suit_start : suit_start + _SUIT_SIZE]))
+        patterns = _prune_dominated_patterns(
+            {
+                (melds + suit_melds, tatsu + suit_tatsu, pairs + suit_pairs, max(state, suit_state))
+                for melds, tatsu, pairs, state in patterns
+                for suit_melds, suit_tatsu, suit_pairs, suit_state in suit_patterns
+            }
+        )
+
+    for melds, tatsu, pairs, state in patterns:
+        n_mentsu_kouho = melds + tatsu + max(pairs - 1, 0)
+        # a hand without a pair whose isolated tiles are all fourth copies cannot wait on them
+        no_pair_wait = not pairs and state == _ISOLATED_FOUR_COPIES
+        shanten = 8 - melds * 2 - tatsu - pairs + no_pair_wait + max(n_mentsu_kouho - 4, 0)
+
+        if shanten != AGARI_STATE and shanten < number_jidahai:
+            shanten = number_jidahai
+
+        min_shanten = min(min_shanten, shanten)
+
+    return min_shanten
+
+
+@lru_cache(maxsize=65536)
+def _suit_patterns(suit_tiles: tuple[int, ...]) -> tuple[_Pattern, ...]:
+    """Return the non-dominated (melds, tatsu, pairs, isolated state) decompositions of one suit."""
+    # the zero padding lets the search look up to three tiles ahead without bounds checks
+    tiles = [*suit_tiles, 0, 0, 0]
+    four_copies = sum(1 << i for i, count in enumerate(suit_tiles) if count == 4)
+    patterns: set[_Pattern] = set()
+    _search_suit(tiles, 0, 0, 0, 0, 0, four_copies, patterns)
+    return tuple(_prune_dominated_patterns(patterns))
+
+
+def _prune_dominated_patterns(patterns: set[_Pattern]) -> set[_Pattern]:
+    """Drop patterns that can never give a lower shanten than another pattern of the same set."""
+    # More melds, tatsu or pairs never increase the shanten number, so a pattern that is
+    # matched or beaten in every component by another one can be discarded.
+    return {
+        pattern
+        for pattern in patterns
+        if not any(
+            other != pattern
+            and other[0] >= pattern[0]
+            and other[1] >= pattern[1]
+            and other[2] >= pattern[2]
+            and _ISOLATED_STATE_RANK[other[3]] >= _ISOLATED_STATE_RANK[pattern[3]]
+            for other in patterns
+        )
+    }
+
+
+def _search_suit(
+    tiles: list[int],
+    depth: int,
+    melds: int,
+    tatsu: int,
+    pairs: int,
+    isolated: int,
+    four_copies: int,
+    patterns: set[_Pattern],
+) -> None:
+    """Collect every decomposition of the suit reachable from ``depth`` into ``patterns``."""
+    # The counters are passed by value, so only the tile buffer has to be restored
+    # after each recursive call.
+    while depth < _SUIT_SIZE and not tiles[depth]:
+        depth += 1
+
+    if depth >= _SUIT_SIZE:
+        if not isolated:
+            isolated_state = _NO_ISOLATED
+        elif (four_copies | isolated) == four_copies:
+            isolated_state = _ISOLATED_FOUR_COPIES
+        else:
+            isolated_state = _ISOLATED_OTHER
+        patterns.add((melds, tatsu, pairs, isolated_state))
+        return
+
+    count = tiles[depth]
+    if count == 1:
+        _search_single(tiles, depth, melds, tatsu, pairs, isolated, four_copies, patterns)
+    elif count == 2:
+        _search_pair(tiles, depth, melds, tatsu, pairs, isolated, four_copies, patterns)
+    elif count == 3:
+        _search_triplet(tiles, depth, melds, tatsu, pairs, isolated, four_copies, patterns)
+    else:
+        _search_quad(tiles, depth, melds, tatsu, pairs, isolated, four_copies, patterns)
+
+
+def _search_quad(
+    tiles: list[int],
+    depth: int,
+    melds: int,
+    tatsu: int,
+    pairs: int,
+    isolated: int,
+    four_copies: int,
+    patterns: set[_Pattern],
+) -> None:
+    """Branch on a tile with four copies at ``depth``."""
+    tiles[depth] -= 3
+    if tiles[depth + 2]:
+        if tiles[depth + 1]:
+            tiles[depth] -= 1
+            tiles[depth + 1] -= 1
+            tiles[depth + 2] -= 1
+            _search_suit(tiles, depth + 1, melds + 2, tatsu, pairs, isolated, four_copies, patterns)
+            tiles[depth] += 1
+            tiles[depth + 1] += 1
+            tiles[depth + 2] += 1
+        tiles[depth] -= 1
+        tiles[depth + 2] -= 1
+        _search_suit(tiles, depth + 1, melds + 1, tatsu + 1, pairs, isolated, four_copies, patterns)
+        tiles[depth] += 1
+        tiles[depth + 2] += 1
+
+    if tiles[depth + 1]:
+        tiles[depth] -= 1
+        tiles[depth + 1] -= 1
+        _search_suit(tiles, depth + 1, melds + 1, tatsu + 1, pairs, isolated, four_copies, patterns)
+        tiles[depth] += 1
+        tiles[depth + 1] += 1
+
+    tiles[depth] -= 1
+    _search_suit(tiles, depth + 1, melds + 1, tatsu, pairs, isolated | 1 << depth, four_copies, patterns)
+    # take a pair out instead of the set
+    tiles[depth] += 2
+
+    if tiles[depth + 2]:
+        if tiles[depth + 1]:
+            tiles[depth] -= 1
+            tiles[depth + 1] -= 1
+            tiles[depth + 2] -= 1
+            _search_suit(tiles, depth, melds + 1, tatsu, pairs + 1, isolated, four_copies, patterns)
+            tiles[depth] += 1
+            tiles[depth + 1] += 1
+            tiles[depth + 2] += 1
+        tiles[depth] -= 1
+        tiles[depth + 2] -= 1
+        _search_suit(tiles, depth + 1, melds, tatsu + 1, pairs + 1, isolated, four_copies, patterns)
+        tiles[depth] += 1
+        tiles[depth + 2] += 1
+
+    if tiles[depth + 1]:
+        tiles[depth] -= 1
+        tiles[depth + 1] -= 1
+        _search_suit(tiles, depth + 1, melds, tatsu + 1, pairs + 1, isolated, four_copies, patterns)
+        tiles[depth] += 1
+        tiles[depth + 1] += 1
+
+    tiles[depth] += 2
+
+
+def _search_triplet(
+    tiles: list[int],
+    depth: int,
+    melds: int,
+    tatsu: int,
+    pairs: int,
+    isolated: int,
+    four_copies: int,
+    patterns: set[_Pattern],
+) -> None:
+    """Branch on a tile with three copies at ``depth``."""
+    tiles[depth] -= 3
+    _search_suit(tiles, depth + 1, melds + 1, tatsu, pairs, isolated, four_copies, patterns)
+    # take a pair out instead of the set
+    tiles[depth] += 1
+
+    if tiles[depth + 1] and tiles[depth + 2]:
+        tiles[depth] -= 1
+        tiles[depth + 1] -= 1
+        tiles[depth + 2] -= 1
+        _search_suit(tiles, depth + 1, melds + 1, tatsu, pairs + 1, isolated, four_copies, patterns)
+        tiles[depth] += 1
+        tiles[depth + 1] += 1
+        tiles[depth + 2] += 1
+    else:
+        if tiles[depth + 2]:
+            tiles[depth] -= 1
+            tiles[depth + 2] -= 1
+            _search_suit(tiles, depth + 1, melds, tatsu + 1, pairs + 1, isolated, four_copies, patterns)
+            tiles[depth] += 1
+            tiles[depth + 2] += 1
+
+        if tiles[depth + 1]:
+            tiles[depth] -= 1
+            tiles[depth + 1] -= 1
+            _search_suit(tiles, depth + 1, melds, tatsu + 1, pairs + 1, isolated, four_copies, patterns)
+            tiles[depth] += 1
+            tiles[depth + 1] += 1
+
+    tiles[depth] += 2
+
+    if tiles[depth + 2] >= 2 and tiles[depth + 1] >= 2:
+        tiles[depth] -= 2
+        tiles[depth + 1] -= 2
+        tiles[depth + 2] -= 2
+        _search_suit(tiles, depth, melds + 2, tatsu, pairs, isolated, four_copies, patterns)
+        tiles[depth] += 2
+        tiles[depth + 1] += 2
+        tiles[depth + 2] += 2
+
+
+def _search_pair(
+    tiles: list[int],
+    depth: int,
+    melds: int,
+    tatsu: int,
+    pairs: int,
+    isolated: int,
+    four_copies: int,
+    patterns: set[_Pattern],
+) -> None:
+    """Branch on a tile with two copies at ``depth``."""
+    tiles[depth] -= 2
+    _search_suit(tiles, depth + 1, melds, tatsu, pairs + 1, isolated, four_copies, patterns)
+    tiles[depth] += 2
+    if tiles[depth + 2] and tiles[depth + 1]:
+        tiles[depth] -= 1
+        tiles[depth + 1] -= 1
+        tiles[depth + 2] -= 1
+        _search_suit(tiles, depth, melds + 1, tatsu, pairs, isolated, four_copies, patterns)
+        tiles[depth] += 1
+        tiles[depth + 1] += 1
+        tiles[depth + 2] += 1
+
+
+def _search_single(
+    tiles: list[int],
+    depth: int,
+    melds: int,
+    tatsu: int,
+    pairs: int,
+    isolated: int,
+    four_copies: int,
+    patterns: set[_Pattern],
+) -> None:
+    """Branch on a tile with a single copy at ``depth``."""
+    if tiles[depth + 1] == 1 and tiles[depth + 2] and tiles[depth + 3] != 4:
+        tiles[depth] -= 1
+        tiles[depth + 1] -= 1
+        tiles[depth + 2] -= 1
+        _search_suit(tiles, depth + 2, melds + 1, tatsu, pairs, isolated, four_copies, patterns)
+        tiles[depth] += 1
+        tiles[depth + 1] += 1
+        tiles[depth + 2] += 1
+    else:
+        tiles[depth] -= 1
+        _search_suit(tiles, depth + 1, melds, tatsu, pairs, isolated | 1 << depth, four_copies, patterns)
+        tiles[depth] += 1
+
+        if tiles[depth + 2]:
+            if tiles[depth + 1]:
+                tiles[depth] -= 1
+                tiles[depth + 1] -= 1
+                tiles[depth + 2] -= 1
+                _search_suit(tiles, depth + 1, melds + 1, tatsu, pairs, isolated, four_copies, patterns)
+                tiles[depth] += 1
+                tiles[depth + 1] += 1
+                tiles[depth + 2] += 1
+            tiles[depth] -= 1
+            tiles[depth + 2] -= 1
+            _search_suit(tiles, depth + 1, melds, tatsu + 1, pairs, isolated, four_copies, patterns)
+            tiles[depth] += 1
+            tiles[depth + 2] += 1
+
+        if tiles[depth + 1]:
+            tiles[depth] -= 1
+            tiles[depth + 1] -= 1
+            _search_suit(tiles, depth + 1, melds, tatsu + 1, pairs, isolated, four_copies, patterns)
+            tiles[depth] += 1
+            tiles[depth + 1] += 1
@@ -1,9 +1,15 @@
-from collections import Counter
 from collections.abc import Collection, Sequence
+from functools import lru_cache
 from typing import Any
 
 from mahjong.constants import FIVE_RED_MAN, FIVE_RED_PIN, FIVE_RED_SOU
 
+# position of each mpsz suit letter in the (man, pin, sou, honors) order
+_SUIT_LETTER_INDICES = {"m": 0, "p": 1, "s": 2, "z": 3, "h": 3}
+
+# rank digit of each 136-format index within a suit
+_RANK_CHARS = tuple(str((i >> 2) + 1) for i in range(36))
+
 
 class Tile:
     """
@@ -18,6 +24,8 @@ class Tile:
     :vartype is_tsumogiri: Any
     """
 
+    __slots__ = ("is_tsumogiri", "value")
+
     value: Any
     is_tsumogiri: Any
 
@@ -57,17 +65,25 @@ class TilesConverter:
         :param print_aka_dora: render red fives as ``0`` instead of ``5``
         :return: mpsz-notation string representing the tiles
         """
-        tiles = sorted(tiles)
-
-        man = [t for t in tiles if t < 36]
-        pin = [t - 36 for t in tiles if 36 <= t < 72]
-        sou = [t - 72 for t in tiles if 72 <= t < 108]
-        honors = [t - 108 for t in tiles if t >= 108]
+        man: list[int] = []
+        pin: list[int] = []
+        sou: list[int] = []
+        honors: list[int] = []
+        for t in tiles:
+            if t < 36:
+                man.append(t)
+            elif t < 72:
+                pin.append(t - 36)
+            elif t < 108:
+                sou.append(t - 72)
+            else:
+                honors.append(t - 108)
 
         def words(suits: list[int], red_five: int, suffix: str) -> str:
             if not suits:
                 return ""
-            return "".join(["0" if i == red_five and print_aka_dora else str((i // 4) + 1) for i in suits]) + suffix
+            suits.sort()
+            return "".join(["0" if i == red_five and print_aka_dora else _RANK_CHARS[i] for i in suits]) + suffix
 
         man_words = words(man, FIVE_RED_MAN, "m")
         pin_words = words(pin, FIVE_RED_PIN - 36, "p")
@@ -92,7 +108,7 @@ class TilesConverter:
         """
         results = [0] * 34
         for tile in tiles:
-            results[tile // 4] += 1
+            results[tile >> 2] += 1
         return results
 
     @staticmethod
@@ -112,8 +128,9 @@ class TilesConverter:
         """
         results: list[int] = []
         for index, count in enumerate(tiles):
-            base_id = index * 4
-            results.extend(base_id + i for i in range(count))
+            if count:
+                base_id = index * 4
+                results.extend(range(base_id, base_id + count))
         return results
 
     @staticmethod
@@ -121,24 +138,25 @@ class TilesConverter:
         if not string:
             return []
 
-        counts: Counter[int] = Counter()
+        # copies already used of each rank, indexed by rank - 1 (``0`` without aka support lands on -1)
+        counts = [0] * 10
         result: list[int] = []
 
-        explicit_aka = {"r", "0"}
         for ch in string:
             # explicit aka markers
-            if ch in explicit_aka and red is not None:
+            if red is not None and ch in ("r", "0"):
                 result.append(red)
                 continue
 
-            tile = offset + (int(ch) - 1) * 4
+            rank_index = int(ch) - 1
+            tile = offset + rank_index * 4
             # numeric '5' should not map to aka id when aka support is present
-            if red is not None and tile == red:
+            if tile == red:
                 tile += 1
 
-            count_of_tiles = counts[tile]
+            count_of_tiles = counts[rank_index]
             result.append(tile + count_of_tiles)
-            counts[tile] += 1
+            counts[rank_index] = count_of_tiles + 1
 
         return result
 
@@ -169,11 +187,23 @@ class TilesConverter:
         :param has_aka_dora: enable red five handling (``0`` and ``r`` map to aka dora)
         :return: list of tile indices in 136-format
         """
+        return list(TilesConverter._string_to_136_tuple(sou, pin, man, honors, has_aka_dora))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _string_to_136_tuple(
+        sou: str | None,
+        pin: str | None,
+        man: str | None,
+        honors: str | None,
+        has_aka_dora: bool,
+    ) -> tuple[int, ...]:
+        # cached as a tuple, so callers get a fresh list they are free to modify
         results = TilesConverter._split_string(man, 0, FIVE_RED_MAN if has_aka_dora else None)
         results += TilesConverter._split_string(pin, 36, FIVE_RED_PIN if has_aka_dora else None)
         results += TilesConverter._split_string(sou, 72, FIVE_RED_SOU if has_aka_dora else None)
         results += TilesConverter._split_string(honors, 108)
-        return results
+        return tuple(results)
 
     @staticmethod
     def string_to_34_array(
@@ -220,17 +250,13 @@ class TilesConverter:
         if tile34 is None or tile34 > 33:
             return None
 
-        tile = tile34 * 4
+        base_id = tile34 * 4
+        # membership is tested directly, so callers holding a set get constant-time lookups
+        for tile in range(base_id, base_id + 4):
+            if tile in tiles:
+                return tile
 
-        possible_tiles = [tile] + [tile + i for i in range(1, 4)]
-
-        found_tile = None
-        for possible_tile in possible_tiles:
-            if possible_tile in tiles:
-                found_tile = possible_tile
-                break
-
-        return found_tile
+        return None
 
     @staticmethod
     def one_line_string_to_136_array(string: str, has_aka_dora: bool = False) -> list[int]:
@@ -254,28 +280,22 @@ class TilesConverter:
         :param has_aka_dora: enable red five handling (``0`` and ``r`` map to aka dora)
         :return: list of tile indices in 136-format
         """
-        sou = ""
-        pin = ""
-        man = ""
-        honors = ""
+        return list(TilesConverter._one_line_string_to_136_tuple(string, has_aka_dora))
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _one_line_string_to_136_tuple(string: str, has_aka_dora: bool) -> tuple[int, ...]:
+        # digits of each suit in man, pin, sou, honors order, gathered in one pass
+        suits = ["", "", "", ""]
         split_start = 0
-
-        for index, i in enumerate(string):
-            if i == "m":
-                man += string[split_start:index]
-                split_start = index + 1
-            if i == "p":
-                pin += string[split_start:index]
-                split_start = index + 1
-            if i == "s":
-                sou += string[split_start:index]
-                split_start = index + 1
-            if i in {"z", "h"}:
-                honors += string[split_start:index]
+        for index, char in enumerate(string):
+            suit = _SUIT_LETTER_INDICES.get(char)
+            if suit is not None:
+                suits[suit] += string[split_start:index]
                 split_start = index + 1
 
-        return TilesConverter.string_to_136_array(sou, pin, man, honors, has_aka_dora)
+        man, pin, sou, honors = suits
+        return TilesConverter._string_to_136_tuple(sou, pin, man, honors, has_aka_dora)
 
     @staticmethod
     def one_line_string_to_34_array(string: str, has_aka_dora: bool = False) -> list[int]:
@@ -40,6 +40,22 @@ from typing import TypedDict
 
 from mahjong.constants import AKA_DORAS, EAST, HAKU, NORTH, TERMINAL_INDICES
 
+# ranks 8 and 9 of each suit, which point to a terminal as the dora
+_TERMINAL_DORA_INDICATORS = frozenset([7, 8, 16, 17, 25, 26])
+
+# (tile, left neighbor, right neighbor) for each suited tile; 1 and 9 use themselves for the missing side
+_SUITED_TILE_NEIGHBORS = tuple((x, x if x % 9 == 0 else x - 1, x if x % 9 == 8 else x + 1) for x in range(27))
+
+# dora tile (34-format) pointed to by each dora indicator (34-format)
+_DORA_34_BY_INDICATOR_34 = (
+    # suited tiles wrap within each suit of 9
+    *(suit_base + (rank + 1) % 9 for suit_base in (0, 9, 18) for rank in range(9)),
+    # winds (27-30) wrap within group of 4
+    *(EAST + (offset + 1) % 4 for offset in range(NORTH - EAST + 1)),
+    # dragons (31-33) wrap within group of 3
+    *(HAKU + (offset + 1) % 3 for offset in range(3)),
+)
+
 
 def is_aka_dora(tile_136: int, aka_enabled: bool) -> bool:
     """
@@ -86,61 +102,22 @@ def plus_dora(tile_136: int, dora_indicators_136: Collection[int], add_aka_dora:
     :param add_aka_dora: include aka dora (red five) bonus in the count
     :return: total dora count for this tile
     """
-    tile_index = tile_136 // 4
+    tile_index = tile_136 >> 2
     dora_count = 0
 
     if add_aka_dora and is_aka_dora(tile_136, aka_enabled=True):
         dora_count += 1
 
     for dora_indicator in dora_indicators_136:
-        dora = dora_indicator // 4
-
-        # sou, pin, man
-        if tile_index < EAST:
-            # with indicator 9, dora will be 1
-            if dora == 8:
-                dora = -1
-            elif dora == 17:
-                dora = 8
-            elif dora == 26:
-                dora = 17
-
-            if tile_index == dora + 1:
-                dora_count += 1
-        else:
-            if dora < EAST:
-                continue
-
-            dora -= 9 * 3
-            tile_index_temp = tile_index - 9 * 3
-
-            # dora indicator is north
-            if dora == 3:
-                dora = -1
-
-            # dora indicator is hatsu
-            if dora == 6:
-                dora = 3
-
-            if tile_index_temp == dora + 1:
-                dora_count += 1
+        if tile_index == _DORA_34_BY_INDICATOR_34[dora_indicator >> 2]:
+            dora_count += 1
 
     return dora_count
 
 
 def _indicator_to_dora_34(indicator_34: int) -> int:
     """Convert a dora indicator (34-format) to the actual dora tile (34-format)."""
-    # suited tiles wrap within each suit of 9
-    if indicator_34 < EAST:
-        suit_base = (indicator_34 // 9) * 9
-        return suit_base + (indicator_34 - suit_base + 1) % 9
-
-    # winds (27-30) wrap within group of 4
-    if indicator_34 <= NORTH:
-        return EAST + (indicator_34 - EAST + 1) % 4
-
-    # dragons (31-33) wrap within group of 3
-    return HAKU + (indicator_34 - HAKU + 1) % 3
+    return _DORA_34_BY_INDICATOR_34[indicator_34]
 
 
 def build_dora_count_map(dora_indicators_136: Collection[int]) -> dict[int, int]:
@@ -163,7 +140,7 @@ def build_dora_count_map(dora_indicators_136: Collection[int]) -> dict[int, int]
     """
     dora_map: dict[int, int] = {}
     for indicator in dora_indicators_136:
-        dora_34 = _indicator_to_dora_34(indicator // 4)
+        dora_34 = _DORA_34_BY_INDICATOR_34[indicator >> 2]
         dora_map[dora_34] = dora_map.get(dora_34, 0) + 1
     return dora_map
 
@@ -468,7 +445,7 @@ def is_dora_indicator_for_terminal(tile: int) -> bool:
     :param tile: tile index in 34-format
     :return: True if the tile is a dora indicator for a terminal
     """
-    return tile in {7, 8, 16, 17, 25, 26}
+    return tile in _TERMINAL_DORA_INDICATORS
 
 
 def contains_terminals(hand_set: Collection[int]) -> bool:
@@ -485,7 +462,7 @@ def contains_terminals(hand_set: Collection[int]) -> bool:
     :param hand_set: collection of tile indices in 34-format
     :return: True if any tile in the set is a terminal
     """
-    return any(x in TERMINAL_INDICES for x in hand_set)
+    return not TERMINAL_INDICES.isdisjoint(hand_set)
 
 
 def simplify(tile: int) -> int:
@@ -527,28 +504,13 @@ def find_isolated_tile_indices(hand_34: Sequence[int]) -> list[int]:
     :param hand_34: hand in 34-format tile count array
     :return: list of 34-format tile indices that are isolated
     """
-    isolated_indices = []
-
-    # check suited tiles (man: 0-8, pin: 9-17, sou: 18-26) in groups of 9
-    for suit_start in (0, 9, 18):
-        for i in range(9):
-            x = suit_start + i
-            if hand_34[x] != 0:
-                continue
-            # 1 suit tile (index 0): check only right neighbor
-            if i == 0:
-                if hand_34[x + 1] == 0:
-                    isolated_indices.append(x)
-            # 9 suit tile (index 8): check only left neighbor
-            elif i == 8:
-                if hand_34[x - 1] == 0:
-                    isolated_indices.append(x)
-            # 2-8 tiles: check both neighbors
-            elif hand_34[x - 1] == 0 and hand_34[x + 1] == 0:
-                isolated_indices.append(x)
+    # a suited tile is isolated when it and both neighbors in its suit are absent
+    isolated_indices = [
+        x for x, left, right in _SUITED_TILE_NEIGHBORS if not (hand_34[x] or hand_34[left] or hand_34[right])
+    ]
 
     # honor tiles (27-33) - no neighbor check needed
-    isolated_indices.extend(x for x in range(27, 34) if hand_34[x] == 0)
+    isolated_indices.extend([x for x in range(27, 34) if hand_34[x] == 0])
 
     return isolated_indices
 
@@ -575,10 +537,10 @@ def is_tile_strictly_isolated(hand_34: Sequence[int], tile_34: int) -> bool:
     :return: True if the tile is strictly isolated
     """
     # honor tiles have no neighbors to check
-    if is_honor(tile_34):
+    if tile_34 >= EAST:
         return hand_34[tile_34] <= 1
 
-    simplified = simplify(tile_34)
+    simplified = tile_34 % 9
 
     # the tile itself should have at most 1 (the one we're checking)
     if hand_34[tile_34] > 1:
@@ -634,20 +596,9 @@ def count_tiles_by_suits(tiles_34: Sequence[int]) -> list[SuitCount]:
     :param tiles_34: hand in 34-format tile count array
     :return: list of :class:`SuitCount` entries, one per suit
     """
-    suits = [
-        SuitCount(count=0, name="sou", function=is_sou),
-        SuitCount(count=0, name="man", function=is_man),
-        SuitCount(count=0, name="pin", function=is_pin),
-        SuitCount(count=0, name="honor", function=is_honor),
+    return [
+        SuitCount(count=sum(tiles_34[18:27]), name="sou", function=is_sou),
+        SuitCount(count=sum(tiles_34[0:9]), name="man", function=is_man),
+        SuitCount(count=sum(tiles_34[9:18]), name="pin", function=is_pin),
+        SuitCount(count=sum(tiles_34[27:34]), name="honor", function=is_honor),
     ]
-
-    for x in range(34):
-        tile = tiles_34[x]
-        if not tile:
-            continue
-
-        for item in suits:
-            if item["function"](x):
-                item["count"] += tile
-
-    return suits
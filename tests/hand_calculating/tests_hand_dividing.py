@@ -105,7 +105,7 @@ def test_block_from_meld_with_invalid_meld_type_raises_runtime_error() -> None:
     # nuki meld has a single tile, which fails is_chi (len != 3),
     # is_pon (len != 3), and is_kan (len != 4)
     meld = Meld(meld_type=Meld.NUKI, tiles=TilesConverter.string_to_136_array(man="1"))
-    with pytest.raises(RuntimeError, match="invalid meld type"):
+    with pytest.raises(RuntimeError, match="invalid meld type: nuki,"):
         _Block.from_meld(meld)
 
 
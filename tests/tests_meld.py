@@ -1,4 +1,8 @@
-from mahjong.meld import Meld
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from mahjong.meld import Meld, MeldType
 from mahjong.tile import TilesConverter
 
 
@@ -14,11 +18,61 @@ def test_meld_repr() -> None:
     assert repr(meld) == str(meld)
 
 
-def test_tiles_34_updates_on_tiles_reassignment() -> None:
+def test_meld_tiles_are_stored_as_bytes() -> None:
+    tiles = TilesConverter.string_to_136_array(honors="777")
+    meld = Meld(meld_type=Meld.PON, tiles=tiles)
+    assert meld.tiles == bytes(tiles)
+    assert meld.tiles[0] == tiles[0]
+    assert list(meld.tiles) == tiles
+
+
+def test_meld_is_immutable() -> None:
     tiles = TilesConverter.string_to_136_array(man="111")
     meld = Meld(meld_type=Meld.PON, tiles=tiles)
+
+    with pytest.raises(FrozenInstanceError):
+        meld.tiles = bytes(TilesConverter.string_to_136_array(man="1111"))
     assert meld.tiles_34 == [0, 0, 0]
 
-    new_tiles = TilesConverter.string_to_136_array(man="1111")
-    meld.tiles = tuple(new_tiles)
-    assert meld.tiles_34 == [0, 0, 0, 0]
+
+def test_meld_equality() -> None:
+    tiles = TilesConverter.string_to_136_array(man="111")
+    meld = Meld(meld_type=Meld.PON, tiles=tiles, who=0, from_who=2)
+
+    assert meld == Meld(meld_type=Meld.PON, tiles=tiles, who=0, from_who=2)
+    assert meld != Meld(meld_type=Meld.PON, tiles=tiles, who=0, from_who=3)
+    assert len({meld, Meld(meld_type=Meld.PON, tiles=tiles, who=0, from_who=2)}) == 1
+
+
+def test_meld_tiles_34_is_computed_from_tiles() -> None:
+    meld = Meld(meld_type=Meld.CHI, tiles=TilesConverter.string_to_136_array(pin="345"))
+    assert meld.tiles_34 == [11, 12, 13]
+    assert Meld().tiles_34 == []
+
+
+@pytest.mark.parametrize(
+    ("meld_type", "is_kan"),
+    [
+        (Meld.CHI, False),
+        (Meld.PON, False),
+        (Meld.KAN, True),
+        (Meld.SHOUMINKAN, True),
+        (Meld.NUKI, False),
+    ],
+)
+def test_meld_is_kan(meld_type: MeldType, is_kan: bool) -> None:
+    meld = Meld(meld_type=meld_type, tiles=TilesConverter.string_to_136_array(man="1111"))
+    assert meld.is_kan is is_kan
+
+
+def test_meld_type_constants_are_meld_types() -> None:
+    assert Meld.CHI is MeldType.CHI
+    assert Meld.PON is MeldType.PON
+    assert Meld.KAN is MeldType.KAN
+    assert Meld.SHOUMINKAN is MeldType.SHOUMINKAN
+    assert Meld.NUKI is MeldType.NUKI
+
+
+def test_meld_str_uses_meld_type_name() -> None:
+    meld = Meld(meld_type=Meld.NUKI, tiles=TilesConverter.string_to_136_array(honors="4"))
+    assert str(meld).startswith("Type: nuki,")
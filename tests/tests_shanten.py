@@ -1,5 +1,6 @@
 import pytest
 
+from mahjong import shanten as shanten_module
 from mahjong.shanten import Shanten
 from mahjong.tile import TilesConverter
 
@@ -10,6 +11,9 @@ from mahjong.tile import TilesConverter
         ("4566677", "1367", "8", "12", 2),
         ("14", "3356", "3678", "2567", 4),
         ("", "", "1111222235555", "1", 0),
+        # complete chiitoitsu and kokushi hands skip the regular hand search
+        ("114477", "114477", "77", "", -1),
+        ("19", "19", "19", "12345677", -1),
     ],
 )
 def test_calculate_shanten(sou: str, pin: str, man: str, honors: str, shanten_number: int) -> None:
@@ -47,6 +51,9 @@ def test_calculate_shanten_raises_error_too_many_tiles() -> None:
         ("1111", "", "333444555", "", 1),
         # hand with an honor pair, triggering pair counting in honor tile pre-processing
         ("111234567", "11", "", "77", 0),
+        # quads spread over several suits, combining the per-suit decompositions
+        ("1111", "1111", "1111", "12", 2),
+        ("1111", "1111", "11112", "", 2),
     ],
 )
 def test_calculate_shanten_for_regular_hand(sou: str, pin: str, man: str, honors: str, shanten_number: int) -> None:
@@ -251,3 +258,24 @@ def test_calculate_shanten_raises_error_for_manzu_in_three_player(man: str) -> N
     tiles = TilesConverter.string_to_34_array(man=man)
     with pytest.raises(ValueError, match="Invalid tile for three player"):
         Shanten.calculate_shanten(tiles, is_three_player=True)
+
+
+def test_calculate_shanten_is_not_affected_by_caller_mutating_tiles() -> None:
+    tiles = TilesConverter.string_to_34_array(sou="111234567", pin="11", man="567")
+    assert Shanten.calculate_shanten(tiles) == Shanten.AGARI_STATE
+
+    tiles[TilesConverter.string_to_34_array(man="7").index(1)] -= 1
+    tiles[TilesConverter.string_to_34_array(man="9").index(1)] += 1
+    assert Shanten.calculate_shanten(tiles) == Shanten.TENPAI_STATE
+
+
+def test_module_level_functions_match_shanten_methods() -> None:
+    tiles = TilesConverter.string_to_34_array(sou="4566677", pin="1367", man="8", honors="12")
+    assert shanten_module.calculate_shanten(tiles) == Shanten.calculate_shanten(tiles) == 2
+    assert shanten_module.calculate_shanten_for_regular_hand(tiles) == Shanten.calculate_shanten_for_regular_hand(tiles)
+    assert shanten_module.calculate_shanten_for_chiitoitsu_hand(tiles) == Shanten.calculate_shanten_for_chiitoitsu_hand(
+        tiles
+    )
+    assert shanten_module.calculate_shanten_for_kokushi_hand(tiles) == Shanten.calculate_shanten_for_kokushi_hand(tiles)
+    assert shanten_module.AGARI_STATE == Shanten.AGARI_STATE
+    assert shanten_module.TENPAI_STATE == Shanten.TENPAI_STATE
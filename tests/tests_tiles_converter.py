@@ -113,3 +113,13 @@ def test_tile_instantiation() -> None:
     tile = Tile(value=tile_value, is_tsumogiri=False)
     assert tile.value == tile_value
     assert tile.is_tsumogiri is False
+
+
+def test_string_to_136_array_is_not_affected_by_caller_mutating_result() -> None:
+    tiles = TilesConverter.one_line_string_to_136_array("123m")
+    tiles.append(12)
+    assert TilesConverter.one_line_string_to_136_array("123m") == [0, 4, 8]
+
+    tiles = TilesConverter.string_to_136_array(man="123")
+    tiles.clear()
+    assert TilesConverter.string_to_136_array(man="123") == [0, 4, 8]
@@ -1,6 +1,6 @@
 from mahjong.hand_calculating.divider import HandDivider
 from mahjong.hand_calculating.hand_config import HandConfig, OptionalRules
-from mahjong.meld import Meld
+from mahjong.meld import Meld, MeldType
 from mahjong.tile import TilesConverter
 
 
@@ -53,7 +53,7 @@ def _hand(tiles: list[int], hand_index: int = 0) -> list[list[int]]:
 
 
 def _make_meld(
-    meld_type: str,
+    meld_type: MeldType,
     is_open: bool = True,
     man: str | None = "",
     pin: str | None = "",